@@ -5,6 +5,8 @@
 import os.path
 from enum import Enum
 from inspect import signature
+from rich.text import Text
+from rich.cells import cell_len
 from rich.table import Table
 from rich.console import Console
 import matplotlib.pyplot as plt
@@ -407,16 +409,116 @@ def write_file(buf:str, results:list[Result]):
         raise ValueError("Could not write file: "+buf)
 
 
-def write_console(results:list[Result]):
-    columns = ("ID", "Name", "% Returned", "Utility", "Total", "Net Investment")
-    console = Console()
-    table = Table(show_header=True, header_style="bold magenta")
-    for column in columns:
-        table.add_column(column)
-    for i, result in enumerate(results):
-        table.add_row("[red]"+str(i)+"[/red]", "[#db7c07]"+result.name+"[/#db7c07]","[green]"+str(result.per_returned*100)+"[/green]", "[blue]"+str(result.utility)+"[/blue]",\
-                      "[white]"+str(result.increments[-1])+"[/white]","[bold]"+str(result.net_investment)+"[/bold]")
-    console.print(table)
+CONSOLE_BATCH = 500
+CONSOLE_COLUMNS = (("ID", "red"), ("Name", "#db7c07"), ("% Returned", "green"), ("Utility", "blue"),\
+                   ("Total", "white"), ("Net Investment", "bold"))
+
+
+@command(name="-l", required=False, alias="--limit")
+def parse_limit(limit:str)->int:
+    """Maximum number of results displayed in the console, it is also
+        the size of a page when used alongside --page. Only affects console
+        output, files always get every result.
+
+         Example:
+          --limit 50
+    """
+    try:
+        n = int(limit)
+    except ValueError:
+        raise ValueError("Limit must be an integer, given "+limit)
+    if n<1:
+        raise ValueError("Limit must be positive, given "+limit)
+    return n
+
+
+@command(name="-p", required=False, alias="--page")
+def parse_page(page:str)->int:
+    """Page of results to display in the console, pages start at 1 and
+        their size is set with --limit.
+
+         Example:
+          --limit 50 --page 3
+          This means display results with ID 100 to 149
+    """
+    try:
+        n = int(page)
+    except ValueError:
+        raise ValueError("Page must be an integer, given "+page)
+    if n<1:
+        raise ValueError("Page must be positive, given "+page)
+    return n
+
+
+def format_result(i:int, result:Result)->tuple[str]:
+    """Cells of a result as displayed in the console"""
+    return (str(i), result.name, f"{result.per_returned*100:.4f}", f"{result.utility:,.2f}",\
+            f"{result.increments[-1]:,.2f}", f"{result.net_investment:,.2f}")
+
+
+def pad(cell:str, width:int, left:bool)->str:
+    """Fill a cell up to width terminal cells, wide characters (CJK, emoji) take two"""
+    fill = " "*(width-cell_len(cell))
+    return cell+fill if left else fill+cell
+
+
+def console_widths(results:list[Result], start:int)->list[int]:
+    """Width in terminal cells of each column for the results displayed, computed
+       from the extremes of each field so that no row has to be formatted beforehand.
+    """
+    widths = [cell_len(column) for column, _ in CONSOLE_COLUMNS]
+    if not results:
+        return widths
+    widths[0] = max(widths[0], len(str(start+len(results)-1)))
+    widths[1] = max(widths[1], max([cell_len(r.name) for r in results]))
+    fields = ((2, lambda r: r.per_returned*100, "{:.4f}"), (3, lambda r: r.utility, "{:,.2f}"),\
+              (4, lambda r: r.increments[-1], "{:,.2f}"), (5, lambda r: r.net_investment, "{:,.2f}"))
+    for index, field, fmt in fields:
+        values = [field(r) for r in results]
+        widths[index] = max(widths[index], len(fmt.format(min(values))), len(fmt.format(max(values))))
+    return widths
+
+
+def write_console(results:list[Result], limit:int=0, page:int=1, console:Console=None):
+    """Display results in batches of CONSOLE_BATCH rows. Column widths are taken from a
+       single pass over the displayed results before the header is written, so the time
+       to first output grows linearly with them but is small (under 0.1s for 100k results).
+       If stdout is not a terminal, or the table does not fit its width, rows are written
+       as plain aligned text. Limit and page select a slice of the results, a limit of 0
+       displays all of them.
+    """
+    start = (page-1)*limit if limit else 0
+    end = start+limit if limit else len(results)
+    shown = results[start:end]
+    console = console if console else Console()
+    if not shown:
+        console.print("No results in page "+str(page))
+        return
+    widths = console_widths(shown, start)
+    if not console.is_terminal or sum(widths)+3*len(widths)>console.width:
+        header = "  ".join(pad(column, w, True) for (column, _), w in zip(CONSOLE_COLUMNS, widths))
+        console.file.write(header.rstrip()+"\n"+"  ".join("-"*w for w in widths)+"\n")
+        for b in range(0, len(shown), CONSOLE_BATCH):
+            rows = (format_result(start+b+i, r) for i, r in enumerate(shown[b:b+CONSOLE_BATCH]))
+            console.file.write("".join("  ".join(pad(cell, w, j<2)\
+                                                 for j, (cell, w) in enumerate(zip(row, widths)))+"\n" for row in rows))
+        console.file.flush()
+        return
+    header = Table(show_header=True, header_style="bold magenta", show_edge=False)
+    for j, ((column, _), w) in enumerate(zip(CONSOLE_COLUMNS, widths)):
+        header.add_column(column, width=w, no_wrap=True, justify="left" if j<2 else "right")
+    console.print(header)
+    styles = []
+    for _, style in CONSOLE_COLUMNS:
+        with console.capture() as capture:
+            console.print(Text("\0", style=style), end="")
+        styles.append(capture.get().split("\0")) #Escape codes surrounding a cell, computed once per column
+    for b in range(0, len(shown), CONSOLE_BATCH):
+        rows = (format_result(start+b+i, r) for i, r in enumerate(shown[b:b+CONSOLE_BATCH]))
+        console.file.write("".join("│".join(pre+" "+pad(cell, w, j<2)+" "+post\
+                                            for j, (cell, w, (pre, post)) in enumerate(zip(row, widths, styles)))+"\n"\
+                                   for row in rows))
+        console.file.flush()
 
 
 @command(name="-g", required=False, alias="--graph")
@@ -527,7 +629,11 @@ def main(args:list[str]):
             results = results[::-1]
         if "-o" not in mask or not mask["-o"]:
             if results:
-                write_console(results)
+                limit = parse_limit(*mask["-l"]) if "-l" in mask and mask["-l"] else 0
+                page = parse_page(*mask["-p"]) if "-p" in mask and mask["-p"] else 1
+                if page>1 and not limit:
+                    raise ValueError("--page requires --limit to set the size of a page")
+                write_console(results, limit, page)
         else:
             write_file(mask["-o"][0], results)
         if "-g" in mask and results:
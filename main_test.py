@@ -1,7 +1,10 @@
 #Excecute tests for compare_interest.py
 #Fernando Lavarreda
 
+import io
 import pytest
+from rich.cells import cell_len
+from rich.console import Console
 import compare_interests as cpi
 
 
@@ -108,3 +111,52 @@ def test_exceptions():
         with pytest.raises(ValueError):
             cpi.process(line.split())
 
+
+def test_console_pages(capsys):
+    """Only the selected page is displayed keeping the original IDs"""
+    lines = cpi.read("tests/t1")
+    results = [cpi.process(line.split()) for line in lines]
+    cpi.write_console(results, limit=3, page=2)
+    rows = capsys.readouterr().out.splitlines()[2:]
+    assert len(rows) == 3
+    assert [row.split()[0] for row in rows] == ["3", "4", "5"]
+    assert rows[0].split()[1] == results[3].name
+    cpi.write_console(results, limit=3, page=4)
+    assert capsys.readouterr().out.strip() == "No results in page 4"
+
+
+def test_console_terminal():
+    """Rows written on a terminal are aligned under the header, wide tables fall back to plain text"""
+    lines = cpi.read("tests/t1")
+    results = [cpi.process(line.split()) for line in lines]
+    results[1].name = "名前😀"
+    buf = io.StringIO()
+    cpi.write_console(results, limit=3, page=1, console=Console(force_terminal=True, width=120, color_system=None, file=buf))
+    header, rule, *rows = buf.getvalue().splitlines()
+    assert [row.split()[0] for row in rows] == ["0", "1", "2"]
+    assert rows[1].split()[2] == results[1].name
+    assert "Name" in header and "Net Investment" in header
+    for row in rows:
+        assert cell_len(row.rstrip()) == cell_len(header.rstrip())
+        assert [cell_len(row[:i]) for i, c in enumerate(row) if c == "│"] == [i for i, c in enumerate(rule) if c == "╇"]
+    buf = io.StringIO()
+    cpi.write_console(results, limit=3, page=1, console=Console(force_terminal=True, width=40, color_system=None, file=buf))
+    header, rule, *rows = buf.getvalue().splitlines()
+    assert header.split()[:2] == ["ID", "Name"]
+    assert "│" not in buf.getvalue()
+    assert [row.split()[0] for row in rows] == ["0", "1", "2"]
+
+
+def test_limit_page():
+    """Parse limit and page"""
+    assert cpi.parse_limit("50") == 50
+    assert cpi.parse_page("3") == 3
+    with pytest.raises(ValueError):
+        cpi.parse_limit("0")
+    with pytest.raises(ValueError):
+        cpi.parse_limit("x")
+    with pytest.raises(ValueError):
+        cpi.parse_page("0")
+    with pytest.raises(ValueError):
+        cpi.parse_page("x")
+    assert cpi.main(["-i", "tests/t1", "--page", "2"]) == 1